@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+from array import array
+from bisect import bisect_right
 from collections import deque
-from threading import Lock
-from typing import Deque, Iterable, List, Optional, Set, Tuple
-from itertools import islice
+from functools import lru_cache
+from threading import Event, Lock
+from typing import Deque, Iterable, List, Optional, Set, Tuple, Union
+from itertools import chain, islice
 import time
 import string
+import re
 
 import pygame
 
@@ -18,8 +22,9 @@ RUNNING = True
 
 # Constants
 TICK = 0.01
-TEXTBOX_LOCK = Lock()
-textboxes = []
+# Replaced rather than mutated, so readers can iterate it without a lock
+textboxes = ()
+TEXTBOX_LOCK = Lock()  # Only held by writers
 active_box = None
 
 DEFAULT_BORDER_WIDTH = 1
@@ -38,12 +43,26 @@ SPLIT_CHARS_BEFORE = list("(<[{_$#@|~N")
 # N splits at end of text object
 
 SPLIT_CHARS_ALL = SPLIT_CHARS_AFTER + SPLIT_CHARS_BEFORE
-SPLIT_CHARS_ALL_SET = set(SPLIT_CHARS_ALL)
-
-DIRTY = False
-
+SPLIT_CHAR_PRIORITY = {char: ind for ind, char in enumerate(SPLIT_CHARS_ALL)}
+# Matches any split char within a string ("N" is not a literal split char)
+SPLIT_CHARS_RE = re.compile(
+    "[" + re.escape("".join(char for char in SPLIT_CHARS_ALL if char != "N")) + "]"
+)
+
+DIRTY = Event()
+DIRTY_EVENT = pygame.event.custom_type()
+REDRAW_ALL = True
+# Return only redrawn rects from render() rather than the whole display
+USE_PARTIAL_UPDATES = True
+# Update the whole display once dirty rects cover this fraction of it
+FULL_UPDATE_RATIO = 0.5
+
+# (font_name, size, bold, italic) -> Font
+# Written without a lock; a single dict.__setitem__ is atomic under the GIL
 font_objects = {}
-FONT_LOCK = Lock()
+LABEL_CACHE_SIZE = 1024
+# pygame-ce's fblits skips building the list of rects blits returns
+HAS_FBLITS = hasattr(pygame.Surface, "fblits")
 
 SCROLL_AMOUNT = 1
 DRAG_DECELERATION = 35
@@ -91,11 +110,30 @@ def _check_char(char: str):
     return
 
 
-def _mark_dirty():
-    """Mark the display dirty (i.e. set to redraw)."""
-    global DIRTY
+def _mark_dirty(text_wrap: _TextWrap = None):
+    """Mark the display dirty (i.e. set to redraw).
 
-    DIRTY = True
+    Parameters
+    ----------
+    text_wrap
+        Only redraw the textbox of this _TextWrap.
+        If None, redraw every textbox and clear the display.
+
+    """
+    global REDRAW_ALL
+
+    if text_wrap is None:
+        REDRAW_ALL = True
+        for textbox in textboxes:
+            textbox.text_wrap.dirty = True
+    else:
+        text_wrap.dirty = True
+
+    if not DIRTY.is_set():
+        DIRTY.set()
+        if pygame.display.get_init():
+            # Wake the interface loop if it is waiting on events
+            pygame.event.post(pygame.event.Event(DIRTY_EVENT))
 
 
 def _coast_scrolls():
@@ -108,7 +146,7 @@ def _coast_scrolls():
 def _check_held_keys():
     """Check for keys being held."""
 
-    if isinstance(active_box, type(None)):
+    if active_box is None:
         # No active box
         return
     if not isinstance(active_box, InputBox):
@@ -133,24 +171,78 @@ def _blink_cursor():
         return
 
     if active_box.blink_cursor():
-        _mark_dirty()
+        _mark_dirty(active_box.text_wrap)
 
 
-def render(display: pygame.Surface, fill_color: Iterable[int] = None):
-    """Render every textbox if DIRTY."""
-    global DIRTY
+def render(
+    display: pygame.Surface, fill_color: Iterable[int] = None
+) -> List[pygame.Rect]:
+    """Render every dirty textbox if DIRTY.
+
+    Returns
+    -------
+    List[pygame.Rect]
+        The areas of the display which were redrawn and must be updated.
+        The whole display is returned once they cover FULL_UPDATE_RATIO of it.
+
+    """
+    global REDRAW_ALL
 
     _coast_scrolls()
     _check_held_keys()
     _blink_cursor()
 
-    if DIRTY:
-        if not isinstance(fill_color, type(None)):
-            display.fill(fill_color)
-        with TEXTBOX_LOCK:
-            for textbox in textboxes:
-                textbox.render(display)
-        DIRTY = False
+    if not DIRTY.is_set():
+        return []
+    # Cleared before drawing so boxes marked dirty meanwhile are drawn next frame
+    DIRTY.clear()
+    redraw_all = REDRAW_ALL
+    REDRAW_ALL = False
+
+    if redraw_all and fill_color is not None:
+        display.fill(fill_color)
+
+    dims = get_dims(display)
+    clip = display.get_clip()
+    visible = []
+    for textbox in textboxes:
+        rect = pygame.Rect(textbox._get_rect(*dims))
+        if rect.colliderect(clip):
+            # Boxes entirely off the display stay dirty until they are visible
+            visible.append((textbox, rect))
+
+    dirty_rects = [
+        rect for textbox, rect in visible if redraw_all or textbox.text_wrap.dirty
+    ]
+    if not redraw_all:
+        # Boxes overlapping a cleared area must be redrawn too
+        added = True
+        while added:
+            added = False
+            for _, rect in visible:
+                if rect not in dirty_rects and rect.collidelist(dirty_rects) != -1:
+                    dirty_rects.append(rect)
+                    added = True
+        if fill_color is not None:
+            for rect in dirty_rects:
+                display.fill(fill_color, rect)
+
+    # Boxes are transparent, so overlapping text is drawn in creation order
+    for textbox, rect in visible:
+        if rect in dirty_rects:
+            textbox.render(display)
+
+    display_rect = display.get_rect()
+    dirty_area = sum(rect.w * rect.h for rect in dirty_rects)
+    full_area = display_rect.w * display_rect.h
+    if (
+        redraw_all
+        or not USE_PARTIAL_UPDATES
+        or dirty_area >= FULL_UPDATE_RATIO * full_area
+    ):
+        # One large update is cheaper than many overlapping ones
+        return [display_rect]
+    return dirty_rects
 
 
 def get_time():
@@ -158,17 +250,31 @@ def get_time():
     return time.time()
 
 
-def _rewrap():
-    """Rewrap all textboxes."""
+def _rewrap(text: Text = None):
+    """Rewrap all textboxes.
+
+    Parameters
+    ----------
+    text
+        If given, only rewrap from the first line containing this text.
+
+    """
     for textbox in textboxes:
-        with textbox.text_wrap.text_lock:
-            textbox.text_wrap.mark_wrap()
+        text_wrap = textbox.text_wrap
+        with text_wrap.text_lock:
+            if text is None:
+                text_wrap.mark_wrap()
+                continue
+            line_num = text_wrap._find_line_num(text)
+            if line_num is not None:
+                text_wrap.mark_wrap(line_num)
 
 
 def _resize_display(size: Iterable[int]) -> pygame.Surface:
     """Resize the display to the given size."""
     _mark_dirty()
-    _rewrap()
+    for textbox in textboxes:
+        textbox._update_rect(*size)
     return pygame.display.set_mode(size, pygame.VIDEORESIZE)
 
 
@@ -181,13 +287,17 @@ def get_dims(display: pygame.Surface) -> Tuple[int]:
 def activate_box(box):
     """Set a textbox to active."""
     global active_box
+
+    # Redraw the cursor of both the previous and new active box
+    for box_ in (active_box, box):
+        if box_ is not None:
+            _mark_dirty(box_.text_wrap)
+
     active_box = box
     for box in textboxes:
         if isinstance(box, InputBox):
             box.reset_key_repeat()
 
-    _mark_dirty()
-
 
 def check_events(
     display: pygame.Surface, events: Iterable[pygame.event.Event]
@@ -213,7 +323,7 @@ def check_events(
             else:
                 if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                     activate_box(None)
-        elif not isinstance(active_box, type(None)):
+        elif active_box is not None:
             active_box.handle_event(event, display)
 
         if event.type == pygame.MOUSEBUTTONUP:
@@ -227,41 +337,125 @@ def check_events(
     return display
 
 
+@lru_cache(maxsize=LABEL_CACHE_SIZE)
+def _rasterize(
+    text: str,
+    pygame_font: pygame.font.Font,
+    color: Tuple[int],
+    highlight: Optional[Tuple[int]],
+) -> pygame.Surface:
+    """Render text to a label surface, memoized until evicted.
+
+    NOTE: Converting requires the display mode to have been set.
+    """
+    if highlight is None:
+        return pygame_font.render(text, 1, color).convert_alpha()
+    # Highlighted labels are opaque, so skip per-pixel alpha when blitting
+    return pygame_font.render(text, 1, color, highlight).convert()
+
+
+def _blit_labels(
+    surface: pygame.Surface, blits: List[Tuple[pygame.Surface, Tuple[int]]]
+):
+    """Draw (label, pos) pairs to the surface with a single call."""
+    if HAS_FBLITS:
+        surface.fblits(blits)
+    else:
+        surface.blits(blits, doreturn=False)
+
+
 def get_font_repr(font_name: str, size: int, bold: bool, italic: bool):
     """Return a string representation of the font object."""
     return f"Font(font_name='{font_name}', size={size}, bold={bold}, italic={italic})"
 
 
 class Font:
-    """Store all values relating to the display of Text."""
+    """Store all values relating to the display of Text.
+
+    Fonts are interned; creating a Font with the same values as an existing one
+    returns that Font rather than loading the system font again.
+
+    Examples
+    --------
+    >>> _ = pygame.init()
+    >>> Font('courier new', 17) is Font('courier new', 17)
+    True
+
+    """
+
+    __slots__ = (
+        "font_name",
+        "size",
+        "bold",
+        "italic",
+        "_key",
+        "pygame_font",
+        "_glyph_widths",
+        "_hyphen_width",
+        "_height",
+    )
+
+    def __new__(
+        cls, font_name: str, size: int, bold: bool = False, italic: bool = False
+    ):
+        font = font_objects.get((font_name, size, bool(bold), bool(italic)))
+        if font is None:
+            font = super().__new__(cls)
+        return font
 
     def __init__(
         self, font_name: str, size: int, bold: bool = False, italic: bool = False
     ):
+        if hasattr(self, "_key"):
+            # Existing font returned by __new__
+            return
 
         self.font_name = font_name
         self.size = size
         self.bold = bold
         self.italic = italic
+        self._key = (font_name, size, bool(bold), bool(italic))
 
         self.pygame_font = None
+        self._glyph_widths = {}
+        self._hyphen_width = None
+        self._height = None
         self._create_pygame_font()
 
-        with FONT_LOCK:
-            font_objects[repr(self)] = self
+        # Keep the first if another thread registered an equal font meanwhile
+        font_objects.setdefault(self._key, self)
 
     def _create_pygame_font(self):
         """Create the pygame Font for blitting to Surfaces."""
         self.pygame_font = pygame.font.SysFont(
             self.font_name, self.size, self.bold, self.italic
         )
+        self._glyph_widths = {}
+        self._hyphen_width = self.pygame_font.size("-")[0]
+        self._height = self.pygame_font.get_linesize()
 
     def get_pygame_font(self) -> pygame.font.Font:
         """Return a memoized pygame font created from the font."""
-        if isinstance(self.pygame_font, type(None)):
+        if self.pygame_font is None:
             self._create_pygame_font()
         return self.pygame_font
 
+    def glyph_width(self, char: str) -> int:
+        """Return the memoized width of a single char."""
+        width = self._glyph_widths.get(char)
+        if width is None:
+            width = self.get_pygame_font().size(char)[0]
+            self._glyph_widths[char] = width
+        return width
+
+    def get_hyphen_width(self) -> int:
+        """Return the width of the hyphen appended to force split text."""
+        return self._hyphen_width
+
+    def get_height(self) -> int:
+        """Return the line spacing of this font."""
+        return self._height
+
     def edit(
         self,
         font_name: str = None,
@@ -284,22 +478,14 @@ class Font:
         Font(font_name='courier new', size=20, bold=False, italic=True)
 
         """
-        global font_objects
         # Get either old or changed values
-        new_font_name = (
-            self.font_name if isinstance(font_name, type(None)) else font_name
-        )
-        new_size = self.size if isinstance(size, type(None)) else size
-        new_bold = self.bold if isinstance(bold, type(None)) else bold
-        new_italic = self.italic if isinstance(italic, type(None)) else italic
-
-        # Check if font already exists
-        new_font_repr = get_font_repr(new_font_name, new_size, new_bold, new_italic)
-        if new_font_repr not in font_objects:
-            new_font = Font(new_font_name, new_size, new_bold, new_italic)
-            with FONT_LOCK:
-                font_objects[new_font_repr] = new_font
-        return font_objects[new_font_repr]
+        new_font_name = self.font_name if font_name is None else font_name
+        new_size = self.size if size is None else size
+        new_bold = self.bold if bold is None else bold
+        new_italic = self.italic if italic is None else italic
+
+        # Returns the existing font if there is one
+        return Font(new_font_name, new_size, new_bold, new_italic)
 
     def __repr__(self) -> str:
         """Return a string representation of the font object."""
@@ -307,19 +493,33 @@ class Font:
 
     def __eq__(self, other) -> bool:
         """Compare the font object to another."""
-        try:
-            font_name = self.font_name == other.font_name
-            size = self.size == other.size
-            bold = self.bold == other.bold
-            italic = self.italic == other.italic
-            return font_name and size and bold and italic
-        except AttributeError:
-            return False
+        return getattr(other, "_key", None) == self._key
+
+    def __hash__(self) -> int:
+        """Hash the font by the same values it is compared with."""
+        return hash(self._key)
 
 
 class Text:
     """Store text supporting fonts and colors."""
 
+    __slots__ = (
+        "all_text",
+        "text_segment",
+        "font",
+        "color",
+        "highlight",
+        "new_line",
+        "label",
+        "original_font_key",
+        "pos",
+        "_size",
+        "_size_key",
+        "_label",
+        "_label_key",
+        "_split_size",
+    )
+
     def __init__(
         self,
         text: str,
@@ -333,17 +533,27 @@ class Text:
         self.all_text = text
 
         self.font = font
-        self.color = color
-        if isinstance(color, type(None)):
-            self.color = DEFAULT_TEXT_COLOR
+        # Stored as tuples so they can key the label cache
+        self.color = DEFAULT_TEXT_COLOR
+        if color is not None:
+            self.color = tuple(color)
         self.highlight = highlight
+        if highlight is not None:
+            self.highlight = tuple(highlight)
 
         self.new_line = new_line
         self.label = label
 
-        self.original_font_repr = repr(self.font)
+        self.original_font_key = self.font._key
         self.pos = None
 
+        self._size = (0, 0)
+        self._size_key = None
+
+        self._label = None
+        self._label_key = None
+        self._split_size = (0, 0)  # Size of the segment kept by the last split
+
     def set_pos(self, pos: Iterable[int]):
         """Set the Text's pos."""
         self.pos = pos
@@ -362,7 +572,7 @@ class Text:
 
     def set_text_segment(self, text_segment: Optional[str]):
         """Set the text_segment until .reset_text() is called."""
-        if not isinstance(text_segment, type(None)):
+        if text_segment is not None:
             self.text_segment = text_segment
 
     def reset_font(self):
@@ -382,7 +592,7 @@ class Text:
         Font(font_name='courier new', size=17, bold=False, italic=False)
 
         """
-        self.set_font(font_objects[self.original_font_repr])
+        self.set_font(font_objects[self.original_font_key])
         _mark_dirty()
 
     def set_font(self, font: Font):
@@ -391,7 +601,7 @@ class Text:
         self.font = font
         new_width = self.get_size(self.text_segment)[0]
         if width != new_width:
-            _rewrap()
+            _rewrap(self)
         _mark_dirty()
 
     def _force_split(self, remaining_width: int, box_width: int) -> Tuple[str]:
@@ -412,28 +622,74 @@ class Text:
             The remaining text which must be added to a new line.
 
         """
-        best_ind = None
-        for ind in range(0, len(self.text_segment)):
-            segment = self.text_segment[: ind + 1] + "-"
-            segment_width = self.get_size(segment)[0]
-            if ind > 0:
-                best_ind = ind - 1
-            if segment_width > remaining_width:
-                if ind == 0 and remaining_width == box_width:
-                    # Single char does not fit on a line to itself
-                    self.text_segment = ""
-                break
-
-        if isinstance(best_ind, type(None)):
+        hyphen_width = self.font.get_hyphen_width()
+        prefix_widths = self.get_prefix_widths(remaining_width - hyphen_width)
+        # Number of chars which fit followed by a hyphen
+        fit_len = bisect_right(prefix_widths, remaining_width - hyphen_width) - 1
+        fit_len = self._fit_prefix(max(fit_len, 0), remaining_width, "-")
+        if fit_len <= 0 and remaining_width == box_width:
+            # Single char does not fit on a line to itself
+            self.text_segment = ""
+        # Always leave at least one char for the next line
+        split_ind = min(fit_len, len(self.text_segment) - 1)
+
+        if split_ind <= 0:
             # Nothing fits on this line, put all on next
             best_segment = ""
             other_segment = self.text_segment
         else:
-            best_segment = self.text_segment[: best_ind + 1] + "-"
-            other_segment = self.text_segment[best_ind + 1 :]
+            best_segment = self.text_segment[:split_ind] + "-"
+            other_segment = self.text_segment[split_ind:]
         self.text_segment = best_segment
+        self._split_size = self.get_size()
         return (best_segment, other_segment)
 
+    def _fit_prefix(self, ind: int, width: int, suffix: str = "") -> int:
+        """Correct a prefix length estimated from the prefix widths.
+
+        Parameters
+        ----------
+        ind
+            The estimated number of chars of the text_segment which fit.
+        width
+            The width the prefix (followed by suffix) must fit in.
+        suffix
+            Text appended to the prefix when rendered.
+
+        Returns
+        -------
+        int
+            The largest number of chars (at least 0) which fit when rendered.
+
+        """
+        text_segment = self.text_segment
+        size = self.font.get_pygame_font().size
+        while ind > 0 and size(text_segment[:ind] + suffix)[0] > width:
+            ind -= 1
+        while (
+            ind < len(text_segment)
+            and size(text_segment[: ind + 1] + suffix)[0] <= width
+        ):
+            ind += 1
+        return ind
+
+    def get_prefix_widths(self, max_width: int) -> array:
+        """Return the estimated width of each prefix of the text_segment.
+
+        Index i holds the sum of the glyph widths of self.text_segment[:i].
+        This ignores kerning and subpixel advances, so a cutoff found in it
+        must be checked with _fit_prefix. Only prefixes up to the first wider
+        than max_width are measured, so long segments cost one line at a time.
+        """
+        prefix_widths = array("l", [0])
+        width = 0
+        for glyph_width in map(self.font.glyph_width, self.text_segment):
+            if width > max_width:
+                break
+            width += glyph_width
+            prefix_widths.append(width)
+        return prefix_widths
+
     def split(self, remaining_width: int, box_width: int) -> Tuple[str]:
         """Split at the optimal location.
 
@@ -465,41 +721,58 @@ class Text:
 
         """
 
-        def _split_chars_sort(char: Iterable[str]) -> int:
-            """Sort an Iterable of split chars."""
-            return SPLIT_CHARS_ALL.index(char)
-
-        possible_split_points = {}
-        if remaining_width < box_width and "N" in SPLIT_CHARS_ALL_SET:
-            possible_split_points["N"] = ("", self.text_segment)
-
-        for ind, char in enumerate(self.text_segment):
-            split_ind = ind
+        # Track the highest priority split char in a single pass
+        # Later occurrences of the same char are preferred
+        best_priority = len(SPLIT_CHARS_ALL)
+        best_ind = None
+        if remaining_width < box_width and "N" in SPLIT_CHAR_PRIORITY:
+            best_priority = SPLIT_CHAR_PRIORITY["N"]
+            best_ind = 0
+
+        # Last index for which all previous chars fit
+        prefix_widths = self.get_prefix_widths(remaining_width)
+        cutoff = bisect_right(prefix_widths, remaining_width) - 1
+        if cutoff >= 0:
+            cutoff = self._fit_prefix(cutoff, remaining_width)
+
+        for match in SPLIT_CHARS_RE.finditer(self.text_segment, 0, cutoff + 1):
+            ind = match.start()
+            char = match.group()
             if char in SPLIT_CHARS_AFTER_SET:
-                split_ind += 1
+                if ind == cutoff:
+                    break  # Splitting after this char would not fit
+                split_ind = ind + 1
             elif ind == 0 and remaining_width == box_width:
                 # Cannot split before first char on a new_line
                 continue
-            text_segment = self.text_segment[:split_ind]
-            other_segment = self.text_segment[split_ind:]
-            text_segment_width = self.get_size(text_segment)[0]
-
-            if text_segment_width <= remaining_width:
-                if char in SPLIT_CHARS_ALL_SET and char != "N":
-                    possible_split_points[char] = (text_segment, other_segment)
             else:
-                break  # Already outside remaining width
+                split_ind = ind
 
-        if possible_split_points:
-            split_chars_sorted = sorted(
-                possible_split_points.keys(), key=_split_chars_sort
+            priority = SPLIT_CHAR_PRIORITY[char]
+            if priority <= best_priority:
+                best_priority = priority
+                best_ind = split_ind
+
+        if best_ind is not None:
+            best_segments = (
+                self.text_segment[:best_ind],
+                self.text_segment[best_ind:],
             )
-            best_split_char = split_chars_sorted[0]
-            best_segments = possible_split_points[best_split_char]
             self.text_segment = best_segments[0]
+            self._split_size = self.get_size()
             return best_segments
         return self._force_split(remaining_width, box_width)
 
+    def get_label(self) -> pygame.Surface:
+        """Return the rendered label of the current text_segment."""
+        font = self.font.get_pygame_font()
+        label_key = (self.text_segment, font, self.color, self.highlight)
+        if label_key != self._label_key:
+            # Texts split across lines alternate segments; fall back to the LRU
+            self._label = _rasterize(*label_key)
+            self._label_key = label_key
+        return self._label
+
     def render(self, display: pygame.Surface):
         """Render the text to the given display.
 
@@ -509,9 +782,7 @@ class Text:
             If text contains a split, a section number must be provided.
 
         """
-        font = self.font.get_pygame_font()
-        label = font.render(self.text_segment, 1, self.color, self.highlight)
-        display.blit(label, self.pos)
+        display.blit(self.get_label(), self.pos)
 
     def get_size(self, text: str = None) -> Tuple[int]:
         """Return the dimensions of the text.
@@ -522,16 +793,38 @@ class Text:
             text to determine the size of. If None, check self.text.
 
         """
-        if isinstance(text, type(None)):
-            text = self.text_segment
-        return self.font.get_pygame_font().size(text)
+        if text is None:
+            # Memoized until the text_segment or font changes
+            size_key = (self.text_segment, self.font)
+            if size_key != self._size_key:
+                self._size = self.font.get_pygame_font().size(self.text_segment)
+                self._size_key = size_key
+            width, height = self._size
+        else:
+            width, height = self.font.get_pygame_font().size(text)
+        # Some labels (e.g. accented capitals) are taller than the line spacing
+        return width, max(height, self.font.get_height())
 
 
 class _Line:
     """Store text in a line."""
 
+    __slots__ = (
+        "text_list",
+        "text_ids",
+        "text_offsets",
+        "width",
+        "height",
+        "pos",
+        "text_segments",
+        "new_line",
+    )
+
     def __init__(self):
-        self.text_list = deque()
+        self.text_list = []
+        self.text_ids = set()  # ids of text_list for constant time membership
+        # x offset of each text in text_list, recorded as it is fit
+        self.text_offsets = []
         self.width = 0
         self.height = 0
         self.pos = None
@@ -546,7 +839,7 @@ class _Line:
 
     def fit_text(
         self, box_text_list: Deque[Text], box_width: int
-    ) -> Tuple[Deque[Text], Tuple[int, str]]:
+    ) -> Tuple[List[Text], Tuple[int, str]]:
         """Add text which fits and return the rest.
 
         Parameters
@@ -575,33 +868,35 @@ class _Line:
 
         """
 
-        def text_needs_wrapped():
-            """Check if text still needs wrapped."""
-            return box_text_list
-
-        added_text = deque()
+        added_text = []
         following_text_segment = ()
 
-        while text_needs_wrapped() and not self.new_line:
-            text = box_text_list.popleft()
+        # Bound once as this loop runs for every text wrapped
+        popleft = box_text_list.popleft
+        text_ids = self.text_ids
+        line_segments = self.text_segments
+
+        while box_text_list and not self.new_line:
+            text = popleft()
             text_id = id(text)
 
-            if text in self.text_list:
+            if text_id in text_ids:
                 # This should only occur if text object reached bottom
                 following_text_segment = (text_id, text.text_segment)
                 box_text_list.appendleft(text)
                 break
 
-            if text_id in self.text_segments:
-                text_segment = self.text_segments[text_id]
-                text.set_text_segment(text_segment)
+            if text_id in line_segments:
+                text.set_text_segment(line_segments[text_id])
 
             text_width, text_height = text.get_size()
 
             if self.width + text_width <= box_width:
+                self.text_offsets.append(self.width)
                 self.width += text_width
                 self.height = max(self.height, text_height)
                 self.text_list.append(text)
+                text_ids.add(text_id)
                 added_text.append(text)
                 if text.new_line:
                     self.new_line = True
@@ -612,13 +907,15 @@ class _Line:
 
                 text_segments = text.split(remaining_width, box_width)
                 if text_segments[0]:
-                    self.text_segments[text_id] = text_segments[0]
+                    line_segments[text_id] = text_segments[0]
 
-                    text_width, text_height = text.get_size()
+                    text_width, text_height = text._split_size
 
+                    self.text_offsets.append(self.width)
                     self.width += text_width
                     self.height = max(self.height, text_height)
                     self.text_list.append(text)
+                    text_ids.add(text_id)
                 if text_segments[1]:
                     following_text_segment = (text_id, text_segments[1])
                     box_text_list.appendleft(text)
@@ -629,32 +926,29 @@ class _Line:
 
     def get_text_segment(self, text):
         """Get the segment of a text object in this line."""
-        text_id = id(text)
-        if text_id in self.text_segments:
-            text_segment = self.text_segments[text_id]
-            return text_segment
-        return text.text_segment
+        return self.text_segments.get(id(text), text.text_segment)
 
     def get_line_string(self):
         """Get the string of text stored by the line."""
-        string = ""
-        for text in self.text_list:
-            string += self.get_text_segment(text)
-        return string
+        return "".join(map(self.get_text_segment, self.text_list))
+
+    def get_blits(self, blits: List[Tuple[pygame.Surface, Tuple[int]]]):
+        """Append the (label, pos) pair of each text in the line to blits."""
+        x, y = self.pos
+        for text, text_x in zip(self.text_list, self.text_offsets):
+            text.set_text_segment(self.get_text_segment(text))
+            text.set_pos((x + text_x, y))
+            blits.append((text.get_label(), text.pos))
 
     def render(self, display: pygame.Surface):
         """Render the line to the display."""
-        text_x = 0
-        for text in self.text_list:
-            text_segment = self.get_text_segment(text)
-            text.set_text_segment(text_segment)
-            text.set_pos((self.pos[0] + text_x, self.pos[1]))
-            text.render(display)
-            text_x += text.get_size()[0]
+        blits = []
+        self.get_blits(blits)
+        _blit_labels(display, blits)
 
     def get_rect(self):
         """Get the bounding rect for this line."""
-        if isinstance(self.pos, type(None)):
+        if self.pos is None:
             raise Exception("Line not yet rendered.")
         return [*self.pos, self.width, self.height]
 
@@ -675,8 +969,7 @@ class _Line:
 
     def __iter__(self):
         """Iterate over the line."""
-        for text in self.text_list:
-            yield text
+        return iter(self.text_list)
 
     def __getitem__(self, ind):
         """Get a Text object at the index."""
@@ -684,10 +977,7 @@ class _Line:
 
     def __contains__(self, text_id):
         """Check if text_id is present in line."""
-        for text in self:
-            if id(text) == text_id:
-                return True
-        return False
+        return text_id in self.text_ids
 
     def __bool__(self):
         """Get a boolean state of this line.
@@ -729,6 +1019,8 @@ class _TextWrap:
 
         self.was_at_bottom = False
 
+        self.dirty = True
+
     def _next_line(self, force_new=False):
         """Get the next line to be filled."""
         if self.lines and not force_new:
@@ -747,26 +1039,21 @@ class _TextWrap:
             Force wrap all lines even if they don't fit on screen.
             
         """
+        if not self.new_text_list:
+            # Nothing pending; the common case for every frame
+            return 0
 
-        def text_needs_wrapped():
-            """Check if text still needs wrapped."""
-            return self.new_text_list
-
-        def within_height():
-            """Check if the current wrapped lines are shorter than height of box."""
-            return self.current_height < self.pos[3]
-
+        assert self.pos is not None
         lines_added = 0
 
-        if text_needs_wrapped() and (all_ or within_height()):
-            assert not isinstance(self.pos, type(None))
-
+        # Only wrap while the wrapped lines are shorter than the box
+        if all_ or self.current_height < self.pos[3]:
             box_width = self.pos[2]
             line = self._next_line(force_new_line)
 
             new_text_segment = None
 
-            while text_needs_wrapped() or line.text_segments:
+            while self.new_text_list or line.text_segments:
                 # NOTE: Final line has text_segment but no text remains to be wrapped
 
                 # Add segments lost after ceasing previous wrap at bottom
@@ -808,13 +1095,19 @@ class _TextWrap:
                             new_text_segment = ()
 
                         line.text_segments.clear()
-                    line.text_list.reverse()
-                    self.new_text_list.extendleft(line.text_list)
+                    self.new_text_list.extendleft(reversed(line.text_list))
                     self._purge_segments([self.new_text_list], False)
                     break
 
+                # A text split over the line break is the only repeat, so drop
+                #   its earlier entry rather than purging the whole list
+                if (
+                    added_text
+                    and self.wrapped_text_list
+                    and self.wrapped_text_list[-1] is added_text[0]
+                ):
+                    self.wrapped_text_list.pop()
                 self.wrapped_text_list.extend(added_text)
-                self._purge_segments([self.wrapped_text_list], False)
                 self.lines.append(line)
                 lines_added += 1
                 if len(self.lines) >= self.line_num:
@@ -833,23 +1126,28 @@ class _TextWrap:
     def _purge_segments(self, lists=None, reset_segment=True):
         """Clear split segments."""
 
-        def _purge_segments_from_list(text_list: Deque, used_text_ids: Set):
+        def _purge_segments_from_list(
+            text_list: Union[Deque, List], used_text_ids: Set
+        ):
             """Clear split segments from the given list in place."""
-            checked_text_list = deque()
-            while text_list:
-                text = text_list.pop()
+            # Walk backwards so the last occurrence of each text is kept
+            checked_text_list = []
+            for text in reversed(text_list):
                 text_id = id(text)
                 if text_id not in used_text_ids:
-                    checked_text_list.appendleft(text)
+                    checked_text_list.append(text)
                     used_text_ids.add(text_id)
                     if reset_segment:
                         text.reset_text()
 
-            text_list.extend(checked_text_list)
+            if len(checked_text_list) != len(text_list):
+                checked_text_list.reverse()
+                text_list.clear()
+                text_list.extend(checked_text_list)
 
         used_text_ids = set()
 
-        if isinstance(lists, type(None)):
+        if lists is None:
             _purge_segments_from_list(self.wrapped_text_list, used_text_ids)
             _purge_segments_from_list(self.new_text_list, used_text_ids)
         else:
@@ -892,6 +1190,7 @@ class _TextWrap:
             # Rewrap previous line in case it is affected
             start_line -= 1
 
+        _mark_dirty(self)
         self._stop_coast()
         purged_line_list = None
         purged_lines = []
@@ -914,11 +1213,19 @@ class _TextWrap:
                 remaining_segment = first_dirty_text.all_text[end_index:]
                 self.remaining_segments[id(first_dirty_text)] = remaining_segment
 
+        if purged_line_list is None:
+            # Full rewrap; hand the wrapped deque over instead of copying it
+            self.wrapped_text_list.extend(self.new_text_list)
+            self.new_text_list = self.wrapped_text_list
+            self.wrapped_text_list = deque()
+            self._purge_segments()
+            return
+
         # Move old lines back into
         old_text = []
         start_ind = None
         for text_num, text in enumerate(self.wrapped_text_list):
-            if isinstance(start_ind, type(None)):
+            if start_ind is None:
                 for line in purged_lines:
                     if id(text) in line:
                         start_ind = text_num
@@ -930,12 +1237,12 @@ class _TextWrap:
         if not old_text:
             old_text = self.wrapped_text_list
         old_text.reverse()
-        if not isinstance(purged_line_list, type(None)):
+        if purged_line_list is not None:
             self._purge_segments(purged_line_list)
         else:
             self._purge_segments()
         self.new_text_list.extendleft(old_text)
-        if not isinstance(start_ind, type(None)):
+        if start_ind is not None:
             self.wrapped_text_list = deque(islice(self.wrapped_text_list, 0, start_ind))
         else:
             self.wrapped_text_list.clear()
@@ -955,14 +1262,14 @@ class _TextWrap:
         """Add text to the current input."""
         with self.text_lock:
             self.new_text_list.extend(text_list)
-        _mark_dirty()
+        _mark_dirty(self)
 
     def get_labeled_text(self, label):
         """Get all text with given label.
 
         Make sure to rewrap and mark dirty.
         """
-        all_text = self.wrapped_text_list + self.new_text_list
+        all_text = chain(self.wrapped_text_list, self.new_text_list)
         return list(filter(lambda x: x.label == label, all_text))
 
     def change_text(self, label, string):
@@ -971,14 +1278,17 @@ class _TextWrap:
             affected_text = self.get_labeled_text(label)
             for text in affected_text:
                 text.change_text(string)
-            first_changed = affected_text[0]
-            line_num = 0
-            for _line_num, line in enumerate(self.lines):
-                if id(first_changed) in line:
-                    line_num = _line_num
-                    break
-            self.mark_wrap(line_num)
-        _mark_dirty()
+            line_num = self._find_line_num(affected_text[0])
+            self.mark_wrap(0 if line_num is None else line_num)
+        _mark_dirty(self)
+
+    def _find_line_num(self, text: Text) -> Optional[int]:
+        """Return the index of the first line containing text, if wrapped."""
+        text_id = id(text)
+        for line_num, line in enumerate(self.lines):
+            if text_id in line:
+                return line_num
+        return None
 
     def _get_lines(self):
         """Return a deque of the current lines from scroll."""
@@ -1009,7 +1319,7 @@ class _TextWrap:
             # Ensure we don't scroll past the last line
             self.scroll_lines(to_scroll)
         self.calculate_height()
-        _mark_dirty()
+        _mark_dirty(self)
 
     def _stop_coast(self):
         """Stop coasting."""
@@ -1044,7 +1354,7 @@ class _TextWrap:
 
     def end_drag(self):
         """Calculate and set drag speed."""
-        if not isinstance(self.drag_start_time, type(None)):
+        if self.drag_start_time is not None:
             time_diff = get_time() - self.drag_start_time
             if time_diff:
                 self.drag_speed = (self.dragged_lines / time_diff) * DRAG_FACTOR
@@ -1089,8 +1399,8 @@ class _TextWrap:
             self.current_height = 0
             self.wrapped_text_list.clear()
             self.new_text_list.clear()
-        _rewrap()
-        _mark_dirty()
+            self.mark_wrap()
+        _mark_dirty(self)
 
     def render(self, display: pygame.Surface, pos: List[int]):
         """Render the lines of text."""
@@ -1103,17 +1413,23 @@ class _TextWrap:
                 # Lock scroll to bottom
                 self.scroll_lines(lines_added - 1)
 
+            # Collected so all labels are drawn with a single blits call
+            blits = []
             line_y = self.pos[1]
             for line in self._get_lines():
                 if line.height + line_y <= self.pos[1] + self.pos[3]:
                     line.set_pos((self.pos[0], line_y))
-                    line.render(display)
+                    line.get_blits(blits)
                     line_y += line.height
                 else:
                     break
 
             self.was_at_bottom = self.at_bottom()
-        return self.was_at_bottom, self.line_num == 0
+            at_top = self.line_num == 0
+
+        # Labels and positions are already resolved, so blit without the lock
+        _blit_labels(display, blits)
+        return self.was_at_bottom, at_top
 
 
 class TextBox:
@@ -1127,7 +1443,19 @@ class TextBox:
 
     """
 
+    __slots__ = (
+        "pins",
+        "border_width",
+        "border_color",
+        "indicator_color",
+        "text_wrap",
+        "pos",
+        "_rect_key",
+        "surface",
+    )
+
     def __init__(self, pins: Iterable[int]):
+        global textboxes
         self.pins = pins  # LONGTERM: Support fixed-width/height
         self.border_width = DEFAULT_BORDER_WIDTH
         self.border_color = DEFAULT_BORDER_COLOR
@@ -1137,9 +1465,14 @@ class TextBox:
         self.text_wrap = _TextWrap()
 
         self.pos = None
+        self._rect_key = None
+
+        # Only redrawn when the text_wrap is dirty
+        self.surface = None
 
         with TEXTBOX_LOCK:
-            textboxes.append(self)
+            textboxes = (*textboxes, self)
+        _mark_dirty(self.text_wrap)
 
     def _get_rect(self, width: int, height: int) -> List[int]:
         """Get coordinates based on self.pins and display resolution.
@@ -1162,15 +1495,33 @@ class TextBox:
         [30, 75, 30, 175]
 
         """
-        # Use pins as percentages to determine corresponding coordinate
-        pos = [self.pins[0] * width, self.pins[1] * height]
-        pos.append(self.pins[2] * width - pos[0])
-        pos.append(self.pins[3] * height - pos[1])
+        # Only recalculate when the display or pins have changed
+        rect_key = (width, height, *self.pins)
+        if rect_key == self._rect_key:
+            return self.pos
 
-        self.pos = [int(x) for x in pos]
+        # Use pins as percentages to determine corresponding coordinate
+        left, top, right, bottom = self.pins
+        x = left * width
+        y = top * height
+        self.pos = [int(x), int(y), int(right * width - x), int(bottom * height - y)]
+        self._rect_key = rect_key
 
         return self.pos
 
+    def _update_rect(self, width: int, height: int):
+        """Recalculate the rect for a new display size.
+
+        Wrapping only depends on the width of the box, so text is only rewrapped
+        when that changes.
+
+        """
+        old_pos = self.pos
+        pos = self._get_rect(width, height)
+        if old_pos is None or old_pos[2] != pos[2]:
+            with self.text_wrap.text_lock:
+                self.text_wrap.mark_wrap()
+
     def handle_event(self, event, display):
         """Handle pygame events relating to scrolling."""
 
@@ -1196,7 +1547,7 @@ class TextBox:
 
             elif event.type == pygame.MOUSEMOTION:
                 # Drag
-                if not isinstance(self.text_wrap.drag_start_time, type(None)):
+                if self.text_wrap.drag_start_time is not None:
                     if self.text_wrap.scroll_drag(
                         self.text_wrap.drag_start_pos, event.pos
                     ):
@@ -1224,43 +1575,73 @@ class TextBox:
         coords = [rect[0], rect[1], rect[2] + rect[0], rect[3] + rect[1]]
         return coords[0] < x < coords[2] and coords[1] < y < coords[3]
 
-    def _draw_box(self, display: pygame.Surface):
-        """Draw the outline of the textbox to the display."""
-        width = display.get_width()
-        height = display.get_height()
-        pos = self._get_rect(width, height)
-        pygame.draw.rect(display, self.border_color, pos, self.border_width)
+    def _draw_box(self, surface: pygame.Surface):
+        """Draw the outline of the textbox to its surface."""
+        pos = surface.get_rect()
+        pygame.draw.rect(surface, self.border_color, pos, self.border_width)
 
-    def _draw_indicator(self, display: pygame.Surface, at_bottom, at_top):
+    def _draw_indicator(self, surface: pygame.Surface, at_bottom, at_top):
         """Draw the indicator to show the box is not at the bottom."""
-        width = display.get_width()
-        height = display.get_height()
-        pos = self._get_rect(width, height)
+        pos = surface.get_rect()
 
         if not at_bottom:
             start_pos = (pos[0], pos[1] + pos[3] - 1)
             end_pos = (pos[0] + pos[2] - 1, pos[1] + pos[3] - 1)
             pygame.draw.line(
-                display, self.indicator_color, start_pos, end_pos, self.border_width + 2
+                surface, self.indicator_color, start_pos, end_pos, self.border_width + 2
             )
 
         if not at_top:
             start_pos = (pos[0], pos[1])
             end_pos = (pos[0] + pos[2] - 1, pos[1])
             pygame.draw.line(
-                display, self.indicator_color, start_pos, end_pos, self.border_width + 2
+                surface, self.indicator_color, start_pos, end_pos, self.border_width + 2
             )
 
+    def _update_surface(self, size: Tuple[int]):
+        """Create a new surface if the size has changed."""
+        if self.surface is not None and self.surface.get_size() == size:
+            return
+
+        # Transparent so whatever is beneath the box shows through
+        self.surface = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+        self.text_wrap.dirty = True
+
+    def _draw_surface(self, surface: pygame.Surface):
+        """Draw the border and text of the textbox to its surface."""
+        surface.fill((0, 0, 0, 0))
+        self._draw_box(surface)
+        at_bottom, at_top = self.text_wrap.render(surface, surface.get_rect())
+        self._draw_indicator(surface, at_bottom, at_top)
+
     def render(self, display: pygame.Surface):
-        """Draw the textbox to the given display."""
-        self._draw_box(display)
-        at_bottom, at_top = self.text_wrap.render(display, self.pos)
-        self._draw_indicator(display, at_bottom, at_top)
+        """Draw the textbox to the given display.
+
+        The textbox's surface is only redrawn if the text_wrap is dirty.
+
+        """
+        pos = self._get_rect(*get_dims(display))
+        self._update_surface((pos[2], pos[3]))
+
+        if self.text_wrap.dirty:
+            # Cleared first so text wrapped in while drawing is drawn next frame
+            self.text_wrap.dirty = False
+            self._draw_surface(self.surface)
+        display.blit(self.surface, (pos[0], pos[1]))
 
 
 class InputBox(TextBox):
     """Allow text input and display said text."""
 
+    __slots__ = (
+        "cursor_index",
+        "cursor_rect",
+        "key_press_times",
+        "key_repeats",
+        "cursor_blink_time",
+        "cursor_blinked",
+    )
+
     def __init__(self, pins: Iterable[int]):
         TextBox.__init__(self, pins)
 
@@ -1303,12 +1684,12 @@ class InputBox(TextBox):
     def insert_char(self, char):
         """Insert a given char at the cursor."""
         char = _check_char(char)
-        if isinstance(char, type(None)):
+        if char is None:
             return
 
         with self.text_wrap.text_lock:
             returns = self._update_cursor_pos()
-            if isinstance(returns, type(None)):
+            if returns is None:
                 return
             line_num, text_obj, index = returns
             all_text = text_obj.all_text
@@ -1333,7 +1714,7 @@ class InputBox(TextBox):
             elif char != "delete":
                 self._update_cursor_pos()
                 self.move_cursor_chars(1)
-        _mark_dirty()
+        _mark_dirty(self.text_wrap)
 
     def move_cursor_direction(self, direction):
         """Move the cursor a given direction.
@@ -1346,7 +1727,7 @@ class InputBox(TextBox):
 
         """
         with self.text_wrap.text_lock:
-            if isinstance(self.cursor_rect, type(None)):
+            if self.cursor_rect is None:
                 return
             if not self.text_wrap.lines:
                 return
@@ -1367,7 +1748,7 @@ class InputBox(TextBox):
 
     def reset_key_repeat(self, key=None):
         """Reset the key repeats."""
-        if isinstance(key, type(None)):
+        if key is None:
             self.key_press_times.clear()
             self.key_repeats.clear()
         else:
@@ -1510,8 +1891,11 @@ class InputBox(TextBox):
                     self._update_cursor_index()
                     break
 
-            self.cursor_rect = [x_pos, y_pos, DEFAULT_CURSOR_WIDTH, height]
-            _mark_dirty()
+            cursor_rect = [x_pos, y_pos, DEFAULT_CURSOR_WIDTH, height]
+            if cursor_rect != self.cursor_rect:
+                # Only a moved cursor needs redrawn
+                self.cursor_rect = cursor_rect
+                _mark_dirty(self.text_wrap)
             break
         return line_num, text_obj, sub_index
 
@@ -1569,7 +1953,7 @@ class InputBox(TextBox):
 
     def _update_cursor_index(self):
         """Determine where the cursor's index is based on it's position."""
-        if isinstance(self.cursor_rect, type(None)):
+        if self.cursor_rect is None:
             return
 
         point = self.cursor_rect[:2]
@@ -1630,27 +2014,28 @@ class InputBox(TextBox):
     def reset_blink(self):
         """Reset blink time to lengthen appearance of cursor."""
         self.cursor_blink_time = get_time()
-        self.cursor_blinked = False
+        if self.cursor_blinked:
+            self.cursor_blinked = False
+            _mark_dirty(self.text_wrap)
 
-    def _draw_cursor(self, display):
+    def _draw_cursor(self, surface):
         """Draw the cursor."""
         self._update_cursor_pos(False)
         self._update_cursor_index()
 
         if not self.cursor_blinked:
-            if not isinstance(self.cursor_rect, type(None)):
-                box_rect = self._get_rect(*get_dims(display))
-                cursor_rect = self.cursor_rect[:]
-                cursor_rect[0] += box_rect[0]
-                cursor_rect[1] += box_rect[1]
-                pygame.draw.rect(display, DEFAULT_CURSOR_COLOR, cursor_rect)
-
-    def render(self, display):
-        """Render the input box and cursor."""
-        TextBox.render(self, display)
+            if self.cursor_rect is not None:
+                pygame.draw.rect(surface, DEFAULT_CURSOR_COLOR, self.cursor_rect)
+
+    def _draw_surface(self, surface):
+        """Draw the input box and cursor to its surface.
+
+        Override parent method.
+        """
+        TextBox._draw_surface(self, surface)
         if active_box is self:
             with self.text_wrap.text_lock:
-                self._draw_cursor(display)
+                self._draw_cursor(surface)
 
 
 if __name__ == "__main__":
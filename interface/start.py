@@ -1,9 +1,9 @@
 """Create the window and handle input."""
 
 from threading import Thread
-from time import sleep
+from time import perf_counter, sleep
 
-from interface.display import render
+from interface.display import render, DIRTY_EVENT, TICK
 import interface.display
 
 import pygame
@@ -19,15 +19,26 @@ def _interface_loop():
     display = pygame.display.set_mode(RESOLUTION, pygame.RESIZABLE)
 
     while get_running():
+        frame_start = perf_counter()
+
         # Render display
-        render(display, (0, 0, 0))
+        dirty_rects = render(display, (0, 0, 0))
+        if dirty_rects:
+            pygame.display.update(dirty_rects)
 
         # Handle events
         events = pygame.event.get()
         display = interface.display.check_events(display, events)
 
-        pygame.display.flip()
-        sleep(.00001)
+        # Sleep until the next frame, waking early if idle and an event arrives
+        timeout = int((TICK - (perf_counter() - frame_start)) * 1000)
+        if timeout > 0:
+            if dirty_rects:
+                sleep(timeout / 1000)
+            else:
+                event = pygame.event.wait(timeout)
+                if event.type not in (pygame.NOEVENT, DIRTY_EVENT):
+                    display = interface.display.check_events(display, [event])
 
 
 def init():